@@ -7,67 +7,117 @@
 # ]
 # ///
 
-import configparser
+import mmap
 import os
+import re
+import stat
 import sys
 
 import click
 
 DEFAULT_CONFIG_PATH = os.path.expanduser("~/.aws/config")
+DELIMITER_RE = re.compile(r"[=:]")
+# Like ConfigParser, anything after the closing bracket is ignored
+SECTION_RE = re.compile(r"\[(?P<name>.+)\]")
+
+
+def parse_ini(text):
+    """Parse INI-style text into a dict of sections mapping keys to values.
+
+    Handles the subset of INI used by AWS config files: `[section]` headers,
+    `key = value` or `key: value` pairs, full-line `#`/`;` comments and indented
+    continuation lines (as used by nested settings such as `s3 =`). Keys are
+    lowercased, as ConfigParser and botocore treat them case-insensitively.
+    """
+    sections = {}
+    current = None
+    key = None
+    # Blank lines seen since the last value line; like ConfigParser, they are
+    # kept inside a value that continues after them, and comments are skipped
+    blank_lines = 0
+    for lineno, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped:
+            blank_lines += 1
+            continue
+        if stripped[0] in "#;":
+            continue
+        if line[0] in " \t" and key is not None:
+            # Continuation of the previous value
+            current[key] += "\n" * (blank_lines + 1) + stripped
+            blank_lines = 0
+            continue
+        blank_lines = 0
+        header = SECTION_RE.match(stripped)
+        if header:
+            current = sections.setdefault(header["name"].strip(), {})
+            key = None
+            continue
+        if current is None:
+            raise ValueError(f"Line {lineno}: key outside of a section: {stripped}")
+        # Like ConfigParser, the first `=` or `:` separates the key from the value
+        key, *value = DELIMITER_RE.split(stripped, maxsplit=1)
+        if not value:
+            raise ValueError(f"Line {lineno}: missing `=` or `:` delimiter: {stripped}")
+        key = key.strip().lower()
+        current[key] = value[0].strip()
+    return sections
 
 
 def load_aws_config(config_path):
-    """Load an AWS config file into a ConfigParser object."""
+    """Load an AWS config file into a dict of sections."""
     if not os.path.exists(config_path):
         click.echo(f"Error: Config file not found: {config_path}", err=True)
         sys.exit(1)
 
-    config = configparser.ConfigParser()
-    config.read(config_path)
-    return config
+    with open(config_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        # Pipes and process substitution report a size of 0 and can't be mapped
+        if not stat.S_ISREG(st.st_mode):
+            return parse_ini(f.read().decode("utf-8"))
+        # mmap cannot map an empty file
+        if st.st_size == 0:
+            return {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_ini(mm[:].decode("utf-8"))
 
 
 def load_config_from_string(config_str):
-    """Load config from a string into a ConfigParser object."""
-    config = configparser.ConfigParser()
-    config.read_string(config_str)
-    return config
+    """Load config from a string into a dict of sections."""
+    return parse_ini(config_str)
 
 
 def merge_configs(base_config, new_config):
-    """Merge two ConfigParser objects, with new_config taking precedence."""
-    merged_config = configparser.ConfigParser()
+    """Merge new_config into base_config in place; new_config takes precedence."""
+    for section, items in new_config.items():
+        base_config.setdefault(section, {}).update(items)
+    return base_config
+
 
-    # Copy all sections from base_config
-    for section in base_config.sections():
-        if not merged_config.has_section(section):
-            merged_config.add_section(section)
-        for key, value in base_config[section].items():
-            merged_config[section][key] = value
+def format_value(value):
+    """Indent continuation lines so nested settings survive a round trip."""
+    return value.replace("\n", "\n    ")
 
-    # Copy and override with new_config
-    for section in new_config.sections():
-        if not merged_config.has_section(section):
-            merged_config.add_section(section)
-        for key, value in new_config[section].items():
-            merged_config[section][key] = value
 
-    return merged_config
+def format_config(config):
+    """Render a config as INI text, with an empty line after each section."""
+    lines = []
+    for section, items in config.items():
+        lines.append(f"[{section}]")
+        lines.extend(f"{key} = {format_value(value)}" for key, value in items.items())
+        lines.append("")
+    return "\n".join(lines) + "\n" if lines else ""
 
 
 def write_config(config, file_path=None):
     """Write config to stdout or to a file if file_path is provided."""
+    output = format_config(config)
     if file_path:
         with open(file_path, "w") as f:
-            config.write(f)
+            f.write(output)
         click.echo(f"Config written to {file_path}")
     else:
-        # Write to stdout in the same format as the original
-        for section in config.sections():
-            click.echo(f"[{section}]")
-            for key, value in config[section].items():
-                click.echo(f"{key} = {value}")
-            click.echo()  # Empty line between sections
+        click.echo(output, nl=False)
 
 
 @click.command(help="Merge AWS config files")
@@ -9,9 +9,10 @@
 # ]
 # ///
 
+import functools
 import json
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import anyio
 import click
@@ -22,16 +23,24 @@ from anthropic import Anthropic
 DEFAULT_MODEL = "claude-3-7-sonnet-latest"
 BASE_IMAGE = "ubuntu:22.04"
 
+# Per-process caches so toilet is only installed and listed once
+_container_cache: Dict[int, dagger.Container] = {}
+_fonts_cache: Optional[List[str]] = None
+
 
 # Dagger utilities
 async def _get_toilet_container(client: dagger.Client) -> dagger.Container:
-    """Create a Dagger container with toilet installed."""
-    return (
-        client.container()
-        .from_(BASE_IMAGE)
-        .with_exec(["apt-get", "update"])
-        .with_exec(["apt-get", "install", "-y", "toilet"])
-    )
+    """Create a Dagger container with toilet installed, once per client."""
+    container = _container_cache.get(id(client))
+    if container is None:
+        container = (
+            client.container()
+            .from_(BASE_IMAGE)
+            .with_exec(["apt-get", "update"])
+            .with_exec(["apt-get", "install", "-y", "toilet"])
+        )
+        _container_cache[id(client)] = container
+    return container
 
 
 async def run_toilet(
@@ -48,14 +57,21 @@ async def run_toilet(
 
 async def list_toilet_fonts(client: dagger.Client) -> List[str]:
     """List available toilet fonts via Dagger by checking font directory."""
-    container = await _get_toilet_container(client)
-    # List .tlf files in /usr/share/figlet/, strip path and extension
-    output = await container.with_exec(["ls", "/usr/share/figlet"]).stdout()
-    print("Raw font directory output:\n", output)  # Debug peek
-    fonts = [
-        f.strip().removesuffix(".tlf") for f in output.split() if f.endswith(".tlf")
-    ]
-    return fonts
+    global _fonts_cache
+    if _fonts_cache is None:
+        container = await _get_toilet_container(client)
+        # List .tlf files in /usr/share/figlet/, strip path and extension
+        output = await container.with_exec(["ls", "/usr/share/figlet"]).stdout()
+        _fonts_cache = [
+            f.strip().removesuffix(".tlf") for f in output.split() if f.endswith(".tlf")
+        ]
+    return _fonts_cache
+
+
+async def _with_dagger(func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """Open one Dagger connection and run func with its client."""
+    async with dagger.connection(dagger.Config(log_output=sys.stderr)):
+        return await func(dagger.dag, *args)
 
 
 # Tool definitions
@@ -89,59 +105,78 @@ def _create_tools() -> List[Dict[str, Any]]:
 async def _process_tool_call(
     tool_call: Dict[str, Any],
     client: Anthropic,
+    dagger_client: dagger.Client,
     model: str,
     prompt: str,
     defaults: Dict[str, Any],
 ) -> Any:
     """Handle tool calls and return Claude's response."""
+    tool_result: Dict[str, Any] = {
+        "type": "tool_result",
+        "tool_use_id": tool_call["id"],
+    }
     try:
         if tool_call["name"] == "format_text":
             text = tool_call["input"].get("text", defaults.get("text"))
             font = tool_call["input"].get("font", defaults.get("font"))
-            result = await run_toilet(text, font)
+            tool_result["content"] = await run_toilet(dagger_client, text, font)
         elif tool_call["name"] == "list_fonts":
-            result = "\n".join(await list_toilet_fonts())
+            fonts = await list_toilet_fonts(dagger_client)
+            tool_result["content"] = "\n".join(fonts)
         else:
             raise ValueError(f"Unknown tool: {tool_call['name']}")
-
-        return client.messages.create(
-            model=model,
-            max_tokens=4096,
-            messages=[
-                {"role": "user", "content": prompt},
-                {"role": "assistant", "content": [{"type": "tool_use", **tool_call}]},
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": tool_call["id"],
-                            "content": result,
-                        }
-                    ],
-                },
-            ],
-        )
     except Exception as e:
-        return client.messages.create(
+        tool_result["content"] = f"Error: {e}"
+        tool_result["is_error"] = True
+
+    # The Anthropic client is synchronous; keep it off the event loop
+    return await anyio.to_thread.run_sync(
+        functools.partial(
+            client.messages.create,
             model=model,
             max_tokens=4096,
             messages=[
                 {"role": "user", "content": prompt},
                 {"role": "assistant", "content": [{"type": "tool_use", **tool_call}]},
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": tool_call["id"],
-                            "content": f"Error: {e}",
-                            "is_error": True,
-                        }
-                    ],
-                },
+                {"role": "user", "content": [tool_result]},
             ],
         )
+    )
+
+
+async def _handle_response(
+    dagger_client: Optional[dagger.Client],
+    response: Any,
+    client: Anthropic,
+    model: str,
+    prompt: str,
+    defaults: Dict[str, Any],
+    debug: bool = False,
+) -> None:
+    """Print Claude's response, running any tool calls through Dagger."""
+    for content in response.content:
+        if content.type == "text":
+            print(content.text)
+        elif content.type == "tool_use":
+            tool_call = {"id": content.id, "name": content.name, "input": content.input}
+            if debug:
+                print(f"Tool call: {tool_call}")
+            final_response = await _process_tool_call(
+                tool_call, client, dagger_client, model, prompt, defaults
+            )
+            if debug:
+                print(f"Final response: {final_response}")
+            for final_content in final_response.content:
+                if final_content.type == "text":
+                    print(final_content.text)
+
+
+def _respond(response: Any, *args: Any) -> None:
+    """Handle Claude's response, connecting to Dagger only if it calls a tool."""
+    if any(content.type == "tool_use" for content in response.content):
+        anyio.run(_with_dagger, _handle_response, response, *args)
+    else:
+        anyio.run(_handle_response, None, response, *args)
 
 
 # CLI commands
@@ -160,7 +195,7 @@ def cli():
 def format(text: str, font: Optional[str], model: str, raw: bool, debug: bool):
     """Format TEXT into ASCII art."""
     if raw:
-        print(anyio.run(run_toilet, text, font))
+        print(anyio.run(_with_dagger, run_toilet, text, font))
         return
 
     client = Anthropic()
@@ -181,26 +216,7 @@ def format(text: str, font: Optional[str], model: str, raw: bool, debug: bool):
     if debug:
         print(f"Response: {response}")
 
-    for content in response.content:
-        if content.type == "text":
-            print(content.text)
-        elif content.type == "tool_use":
-            tool_call = {"id": content.id, "name": content.name, "input": content.input}
-            if debug:
-                print(f"Tool call: {tool_call}")
-            final_response = anyio.run(
-                _process_tool_call,
-                tool_call,
-                client,
-                model,
-                prompt,
-                {"text": text, "font": font},
-            )
-            if debug:
-                print(f"Final response: {final_response}")
-            for final_content in final_response.content:
-                if final_content.type == "text":
-                    print(final_content.text)
+    _respond(response, client, model, prompt, {"text": text, "font": font}, debug)
 
 
 @cli.command()
@@ -208,16 +224,14 @@ def format(text: str, font: Optional[str], model: str, raw: bool, debug: bool):
 def fonts(json_output: bool):
     """List available toilet fonts."""
 
-    async def run_fonts():
-        async with dagger.connection(dagger.Config(log_output=sys.stderr)):
-            client = dagger.dag
-            font_list = await list_toilet_fonts(client)
-            if json_output:
-                print(json.dumps({"fonts": font_list}, indent=2))
-            else:
-                print("Available fonts:\n  " + "\n  ".join(font_list))
+    async def run_fonts(client: dagger.Client) -> None:
+        font_list = await list_toilet_fonts(client)
+        if json_output:
+            print(json.dumps({"fonts": font_list}, indent=2))
+        else:
+            print("Available fonts:\n  " + "\n  ".join(font_list))
 
-    anyio.run(run_fonts)
+    anyio.run(_with_dagger, run_fonts)
 
 
 @cli.command()
@@ -235,17 +249,7 @@ def suggest(text: str, model: str):
         messages=[{"role": "user", "content": prompt}],
     )
 
-    for content in response.content:
-        if content.type == "text":
-            print(content.text)
-        elif content.type == "tool_use":
-            tool_call = {"id": content.id, "name": content.name, "input": content.input}
-            final_response = anyio.run(
-                _process_tool_call, tool_call, client, model, prompt, {"text": text}
-            )
-            for final_content in final_response.content:
-                if final_content.type == "text":
-                    print(final_content.text)
+    _respond(response, client, model, prompt, {"text": text})
 
 
 @cli.command()
@@ -254,23 +258,35 @@ def suggest(text: str, model: str):
 def examples(text: str, fonts: int):
     """Generate examples with different fonts."""
 
-    async def run_examples():
-        async with dagger.connection(dagger.Config(log_output=sys.stderr)):
-            client = dagger.dag
-            font_list = await list_toilet_fonts(client)
-            if not font_list:
-                print("No fonts found! Something’s off with the container.")
-                return
-            selected_fonts = font_list[: min(fonts, len(font_list))]
-            print(f"Generating {len(selected_fonts)} examples for: {text}\n")
+    async def run_examples(client: dagger.Client) -> None:
+        font_list = await list_toilet_fonts(client)
+        if not font_list:
+            print("No fonts found! Something’s off with the container.")
+            return
+        selected_fonts = font_list[: min(fonts, len(font_list))]
+        print(f"Generating {len(selected_fonts)} examples for: {text}\n")
+
+        # Render all fonts concurrently, then print in the selected order
+        results: Dict[str, Any] = {}
+
+        async def render(font: str) -> None:
+            try:
+                results[font] = await run_toilet(client, text, font)
+            except Exception as e:
+                results[font] = e
+
+        async with anyio.create_task_group() as tg:
             for font in selected_fonts:
-                try:
-                    output = await run_toilet(client, text, font)
-                    print(f"Font: {font}\n{output}\n")
-                except Exception as e:
-                    print(f"Error with font '{font}': {e}")
+                tg.start_soon(render, font)
+
+        for font in selected_fonts:
+            output = results[font]
+            if isinstance(output, Exception):
+                print(f"Error with font '{font}': {output}")
+            else:
+                print(f"Font: {font}\n{output}\n")
 
-    anyio.run(run_examples)
+    anyio.run(_with_dagger, run_examples)
 
 
 if __name__ == "__main__":
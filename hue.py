@@ -8,27 +8,203 @@
 # ]
 # ///
 
+import http.client
 import json
 import os
+import socket
 import sys
+import time
 from pathlib import Path
 
 import click
-from phue import Bridge, Group, Light, PhueRegistrationException, PhueRequestTimeout
 
 # Configuration file path
 CONFIG_PATH = Path.home() / ".hue-control.json"
 
+# Fail fast on an unreachable bridge instead of hanging; seconds
+CONNECT_TIMEOUT = 0.5
+READ_TIMEOUT = 3.0
+
+# Idle seconds before TCP keepalive probes start on the bridge connection
+KEEPALIVE_IDLE = 30
+
+# How long name -> ID lookup tables are reused before asking the bridge again
+NAME_CACHE_TTL = 30
+
+# Wide gamut RGB -> XYZ conversion matrix used for hex colors
+RGB_TO_XYZ = (
+    (0.664511, 0.154324, 0.162028),
+    (0.283881, 0.668433, 0.047685),
+    (0.000088, 0.072310, 0.986039),
+)
+
+# Predefined scenes, shared with hue_scene_cycler.py
+SCENES = {
+    "relax": {"bri": 144, "ct": 447},  # Warm, dimmed light
+    "concentrate": {"bri": 219, "ct": 233},  # Cool, bright light
+    "energize": {"bri": 254, "ct": 156},  # Very cool, very bright
+    "reading": {"bri": 240, "ct": 346},  # Neutral white, bright
+}
+
+# Named colors accepted by the color command, as CIE xy coordinates
+COLOR_MAP = {
+    "red": (0.675, 0.322),
+    "green": (0.408, 0.517),
+    "blue": (0.167, 0.04),
+    "yellow": (0.508, 0.474),
+    "orange": (0.611, 0.382),
+    "pink": (0.452, 0.261),
+    "purple": (0.244, 0.091),
+    "white": (0.33, 0.33),
+}
+
+
+class KeepAliveConnection(http.client.HTTPConnection):
+    """
+    HTTPConnection with TCP keepalive and separate connect and read timeouts.
+    http.client already disables Nagle's algorithm (TCP_NODELAY) on connect.
+    """
+
+    def __init__(self, host, connect_timeout, read_timeout):
+        super().__init__(host, timeout=connect_timeout)
+        self.read_timeout = read_timeout
+
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # TCP_KEEPIDLE is not available on every platform (e.g. macOS)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            self.sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE
+            )
+        self.sock.settimeout(self.read_timeout)
+
+
+class PersistentConnection:
+    """
+    Send bridge API requests over a single kept-alive HTTP connection.
+    phue opens and closes a new connection for every request, so each
+    command would otherwise pay a TCP handshake per call to the bridge.
+    """
+
+    def __init__(self, ip, connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT):
+        self.ip = ip
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.connection = None
+
+    def request(self, mode="GET", address=None, data=None):
+        """Drop-in replacement for phue's Bridge.request"""
+        body = json.dumps(data) if mode in ("PUT", "POST") else None
+        while True:
+            reused = self.connection is not None
+            if not reused:
+                self.connection = KeepAliveConnection(
+                    self.ip, self.connect_timeout, self.read_timeout
+                )
+            sent = False
+            try:
+                self.connection.request(mode, address, body)
+                sent = True
+                response = self.connection.getresponse()
+                return json.loads(response.read().decode("utf-8"))
+            except TimeoutError:
+                from phue import PhueRequestTimeout
+
+                self.close()
+                raise PhueRequestTimeout(
+                    None, f"{mode} Request to {self.ip}{address} timed out."
+                )
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # The bridge may have dropped the idle connection; reconnect
+                # once. A POST that was already sent may have been applied, so
+                # only GET and PUT, which are safe to repeat, are resent
+                self.close()
+                if not reused or (sent and mode not in ("GET", "PUT")):
+                    raise
+
+    def close(self):
+        """Close the underlying connection"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+def connect_bridge(ip_address):
+    """Create a Bridge whose requests reuse one persistent connection"""
+    from phue import Bridge
+
+    bridge = Bridge(ip_address)
+    bridge.request = PersistentConnection(bridge.ip).request
+    return bridge
+
+
+# Cached name -> ID tables, keyed by (bridge IP, "lights" | "groups")
+_name_cache = {}
+
+
+def _resolve_name(bridge, kind, fetch, name, ttl):
+    """Look up an ID by name, refreshing the cached name table when stale"""
+    key = (bridge.ip, kind)
+    now = time.monotonic()
+    cached = _name_cache.get(key)
+    if cached is None or now - cached[0] > ttl:
+        names = {item["name"]: int(item_id) for item_id, item in fetch().items()}
+        cached = _name_cache[key] = (now, names)
+    return cached[1].get(name)
+
+
+def resolve_light(bridge, name, ttl=NAME_CACHE_TTL):
+    """Resolve a light name to its ID, or None if no light has that name"""
+    return _resolve_name(bridge, "lights", bridge.get_light, name, ttl)
+
+
+def resolve_group(bridge, name, ttl=NAME_CACHE_TTL):
+    """Resolve a group name to its ID, or None if no group has that name"""
+    return _resolve_name(bridge, "groups", bridge.get_group, name, ttl)
+
+
+def _linearize(channel):
+    """Undo sRGB gamma correction for a channel in the 0-1 range"""
+    if channel > 0.04045:
+        return ((channel + 0.055) / 1.055) ** 2.4
+    return channel / 12.92
+
+
+def rgb_to_xy(r, g, b):
+    """Convert RGB (0-1 per channel) to CIE xy coordinates for the Hue gamut"""
+    r, g, b = _linearize(r), _linearize(g), _linearize(b)
+    (xr, xg, xb), (yr, yg, yb), (zr, zg, zb) = RGB_TO_XYZ
+    X = r * xr + g * xg + b * xb
+    Y = r * yr + g * yg + b * yb
+    Z = r * zr + g * zg + b * zb
+
+    sum_XYZ = X + Y + Z
+    if sum_XYZ == 0:
+        return (0.33, 0.33)
+    return (X / sum_XYZ, Y / sum_XYZ)
+
 
 def get_bridge(ip_address=None):
     """
     Connect to the Hue bridge. If no IP address is provided,
     try to load from the config file, or prompt the user.
+    Given a click.Context instead, the bridge is created once per
+    invocation and kept on ctx.obj for the command and its arguments.
     """
+    if isinstance(ip_address, click.Context):
+        obj = ip_address.obj
+        if "_bridge" not in obj:
+            obj["_bridge"] = get_bridge(obj["ip"])
+        return obj["_bridge"]
+
+    # Deferred so --help and other paths that never connect skip importing phue
+    from phue import PhueRegistrationException, PhueRequestTimeout
+
     try:
         # If IP address provided, use it
         if ip_address:
-            bridge = Bridge(ip_address)
+            bridge = connect_bridge(ip_address)
             # Save the IP to config
             save_config({"bridge_ip": ip_address})
             return bridge
@@ -37,7 +213,7 @@ def get_bridge(ip_address=None):
         config = load_config()
         if config and "bridge_ip" in config:
             try:
-                bridge = Bridge(config["bridge_ip"])
+                bridge = connect_bridge(config["bridge_ip"])
                 return bridge
             except Exception as e:
                 click.echo(f"Error connecting to saved bridge: {e}", err=True)
@@ -55,32 +231,84 @@ def get_bridge(ip_address=None):
         sys.exit(1)
 
 
+# Config as last read from or written to CONFIG_PATH during this run
+_config = None
+
+
 def load_config():
     """Load configuration from file if it exists"""
+    global _config
+    if _config is not None:
+        return _config
     if not CONFIG_PATH.exists():
         return None
 
     try:
         with open(CONFIG_PATH, "r") as f:
-            return json.load(f)
+            _config = json.load(f)
     except Exception as e:
         click.echo(f"Error loading config: {e}", err=True)
         return None
+    return _config
 
 
 def save_config(config_data):
-    """Save configuration to file"""
+    """Save configuration to file, skipping the write if nothing changed"""
+    global _config
     # Merge with existing config if it exists
     existing_config = load_config() or {}
-    existing_config.update(config_data)
+    merged_config = {**existing_config, **config_data}
+    if merged_config == existing_config:
+        return
 
+    # Write to a temporary file first so an interrupted save can't truncate
+    # the config
+    tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
     try:
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(existing_config, f)
+        tmp_path.write_text(json.dumps(merged_config))
+        os.replace(tmp_path, CONFIG_PATH)
+        _config = merged_config
     except Exception as e:
         click.echo(f"Error saving config: {e}", err=True)
 
 
+class _BridgeRef(click.ParamType):
+    """
+    Accept a numeric ID or a name and convert it to an integer ID while
+    the arguments are parsed, so commands never handle names themselves.
+    Subclasses set name and the resolver that looks the name up.
+    """
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int):
+            return value
+        if value.isdigit():
+            return int(value)
+
+        bridge = get_bridge(ctx)
+        try:
+            resolved_id = self.resolver(bridge, value)
+        except Exception as e:
+            self.fail(f"Error looking up {self.name} '{value}': {e}", param, ctx)
+        if resolved_id is None:
+            self.fail(f"{self.name.capitalize()} '{value}' not found", param, ctx)
+        return resolved_id
+
+
+class LightRef(_BridgeRef):
+    """A light given by name or ID"""
+
+    name = "light"
+    resolver = staticmethod(resolve_light)
+
+
+class GroupRef(_BridgeRef):
+    """A group given by name or ID"""
+
+    name = "group"
+    resolver = staticmethod(resolve_group)
+
+
 @click.group()
 @click.option("--ip", help="IP address of your Hue Bridge")
 @click.pass_context
@@ -94,40 +322,33 @@ def cli(ctx, ip):
 @click.pass_context
 def list(ctx):
     """List all available lights"""
-    bridge = get_bridge(ctx.obj["ip"])
-    lights = bridge.get_light_objects("id")
+    bridge = get_bridge(ctx)
+    # One GET for every light's state; Light objects would fetch each attribute
+    lights = bridge.get_light()
 
     click.echo("\n=== Available Lights ===")
     for light_id, light in lights.items():
-        status = "ON" if light.on else "OFF"
-        click.echo(f"{light_id}. {light.name} - {status}")
-        click.echo(f"   Brightness: {light.brightness}/254")
-        if light.colormode:
-            if light.colormode == "xy":
-                click.echo(f"   Color (xy): {light.xy}")
-            elif light.colormode == "ct":
-                click.echo(f"   Color Temperature: {light.colortemp_k}K")
-            elif light.colormode == "hs":
-                click.echo(f"   Hue: {light.hue}, Saturation: {light.saturation}")
+        state = light["state"]
+        status = "ON" if state["on"] else "OFF"
+        click.echo(f"{light_id}. {light['name']} - {status}")
+        click.echo(f"   Brightness: {state.get('bri')}/254")
+        colormode = state.get("colormode")
+        if colormode == "xy":
+            click.echo(f"   Color (xy): {state['xy']}")
+        elif colormode == "ct":
+            click.echo(f"   Color Temperature: {int(round(1e6 / state['ct']))}K")
+        elif colormode == "hs":
+            click.echo(f"   Hue: {state['hue']}, Saturation: {state['sat']}")
     click.echo("")
 
 
 @cli.command()
-@click.argument("light_id")
+@click.argument("light_id", type=LightRef())
 @click.pass_context
 def on(ctx, light_id):
     """Turn a light on (use name or ID)"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                light.on = True
-                click.echo(f"Light '{light_id}' turned on")
-                return
-
-        # Otherwise treat as ID
         bridge.set_light(light_id, "on", True)
         click.echo(f"Light {light_id} turned on")
     except Exception as e:
@@ -135,21 +356,12 @@ def on(ctx, light_id):
 
 
 @cli.command()
-@click.argument("light_id")
+@click.argument("light_id", type=LightRef())
 @click.pass_context
 def off(ctx, light_id):
     """Turn a light off (use name or ID)"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                light.on = False
-                click.echo(f"Light '{light_id}' turned off")
-                return
-
-        # Otherwise treat as ID
         bridge.set_light(light_id, "on", False)
         click.echo(f"Light {light_id} turned off")
     except Exception as e:
@@ -157,7 +369,7 @@ def off(ctx, light_id):
 
 
 @cli.command()
-@click.argument("light_id")
+@click.argument("light_id", type=LightRef())
 @click.argument("brightness", type=int)
 @click.option(
     "--transition",
@@ -172,30 +384,20 @@ def brightness(ctx, light_id, brightness, transition):
         click.echo("Brightness must be between 0 and 254", err=True)
         return
 
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                if transition:
-                    light.transitiontime = transition
-                light.brightness = brightness
-                click.echo(f"Light '{light_id}' brightness set to {brightness}")
-                return
-
-        # Otherwise treat as ID
-        kwargs = {}
+        settings = {"bri": brightness}
         if transition:
-            kwargs["transitiontime"] = transition
-        bridge.set_light(light_id, "bri", brightness, **kwargs)
+            settings["transitiontime"] = transition
+
+        bridge.set_light(light_id, settings)
         click.echo(f"Light {light_id} brightness set to {brightness}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
 
 @cli.command()
-@click.argument("light_id")
+@click.argument("light_id", type=LightRef())
 @click.argument("temperature", type=int)
 @click.option(
     "--transition",
@@ -210,33 +412,21 @@ def temperature(ctx, light_id, temperature, transition):
         click.echo("Temperature must be between 2000K and 6500K", err=True)
         return
 
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                if transition:
-                    light.transitiontime = transition
-                light.colortemp_k = temperature
-                click.echo(f"Light '{light_id}' temperature set to {temperature}K")
-                return
-
-        # Otherwise treat as ID
         # Convert Kelvin to mireds (Hue uses mireds internally)
-        mired = int(1000000 / temperature)
-
-        kwargs = {}
+        settings = {"ct": int(1000000 / temperature)}
         if transition:
-            kwargs["transitiontime"] = transition
-        bridge.set_light(light_id, "ct", mired, **kwargs)
+            settings["transitiontime"] = transition
+
+        bridge.set_light(light_id, settings)
         click.echo(f"Light {light_id} temperature set to {temperature}K")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
 
 @cli.command()
-@click.argument("light_id")
+@click.argument("light_id", type=LightRef())
 @click.argument("color", type=str)
 @click.option(
     "--transition",
@@ -247,82 +437,41 @@ def temperature(ctx, light_id, temperature, transition):
 @click.pass_context
 def color(ctx, light_id, color, transition):
     """Set the color of a light (by name or hex)"""
-    # Define some basic colors
-    color_map = {
-        "red": (0.675, 0.322),
-        "green": (0.408, 0.517),
-        "blue": (0.167, 0.04),
-        "yellow": (0.508, 0.474),
-        "orange": (0.611, 0.382),
-        "pink": (0.452, 0.261),
-        "purple": (0.244, 0.091),
-        "white": (0.33, 0.33),
-    }
-
-    xy_color = None
-
-    # Check if it's a named color
-    if color.lower() in color_map:
-        xy_color = color_map[color.lower()]
-    # Check if it's a hex color
-    elif color.startswith("#") and len(color) == 7:
+    xy_color = COLOR_MAP.get(color.casefold())
+    # Not a named color, so check if it's a hex color
+    if xy_color is None:
+        if not (color.startswith("#") and len(color) == 7):
+            click.echo(
+                "Invalid color. Use a color name (red, green, blue, etc.) "
+                "or hex value (#RRGGBB)",
+                err=True,
+            )
+            return
         try:
             # Convert hex to RGB
             r = int(color[1:3], 16) / 255.0
             g = int(color[3:5], 16) / 255.0
             b = int(color[5:7], 16) / 255.0
-
-            # Convert RGB to XY (simplified)
-            r_adj = (r > 0.04045) and ((r + 0.055) / 1.055) ** 2.4 or (r / 12.92)
-            g_adj = (g > 0.04045) and ((g + 0.055) / 1.055) ** 2.4 or (g / 12.92)
-            b_adj = (b > 0.04045) and ((b + 0.055) / 1.055) ** 2.4 or (b / 12.92)
-
-            X = r_adj * 0.664511 + g_adj * 0.154324 + b_adj * 0.162028
-            Y = r_adj * 0.283881 + g_adj * 0.668433 + b_adj * 0.047685
-            Z = r_adj * 0.000088 + g_adj * 0.072310 + b_adj * 0.986039
-
-            sum_XYZ = X + Y + Z
-            if sum_XYZ == 0:
-                xy_color = (0.33, 0.33)
-            else:
-                xy_color = (X / sum_XYZ, Y / sum_XYZ)
+            xy_color = rgb_to_xy(r, g, b)
         except Exception as e:
             click.echo(f"Invalid hex color: {e}", err=True)
             return
-    else:
-        click.echo(
-            "Invalid color. Use a color name (red, green, blue, etc.) or hex value (#RRGGBB)",
-            err=True,
-        )
-        return
 
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                if transition:
-                    light.transitiontime = transition
-                light.xy = xy_color
-                click.echo(f"Light '{light_id}' color set to {color}")
-                return
-
-        # Otherwise treat as ID
-        kwargs = {}
+        settings = {"xy": xy_color}
         if transition:
-            kwargs["transitiontime"] = transition
-        bridge.set_light(light_id, "xy", xy_color, **kwargs)
+            settings["transitiontime"] = transition
+
+        bridge.set_light(light_id, settings)
         click.echo(f"Light {light_id} color set to {color}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
 
 @cli.command()
-@click.argument("light_id")
-@click.argument(
-    "scene", type=click.Choice(["relax", "concentrate", "energize", "reading"])
-)
+@click.argument("light_id", type=LightRef())
+@click.argument("scene", type=click.Choice([*SCENES]))
 @click.option(
     "--transition",
     "-t",
@@ -332,38 +481,15 @@ def color(ctx, light_id, color, transition):
 @click.pass_context
 def scene(ctx, light_id, scene, transition):
     """Apply a predefined scene to a light"""
-    bridge = get_bridge(ctx.obj["ip"])
-
-    scenes = {
-        "relax": {"bri": 144, "ct": 447},  # Warm, dimmed light
-        "concentrate": {"bri": 219, "ct": 233},  # Cool, bright light
-        "energize": {"bri": 254, "ct": 156},  # Very cool, very bright
-        "reading": {"bri": 240, "ct": 346},  # Neutral white, bright
-    }
+    bridge = get_bridge(ctx)
 
     try:
-        settings = scenes[scene].copy()
+        settings = SCENES[scene].copy()
 
         # Add transition time if specified
         if transition:
             settings["transitiontime"] = transition
 
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                # Apply settings one by one to properly use the Light object
-                for key, value in settings.items():
-                    if key == "transitiontime":
-                        light.transitiontime = value
-                    elif key == "bri":
-                        light.brightness = value
-                    elif key == "ct":
-                        light.colortemp = value
-                click.echo(f"Scene '{scene}' applied to light '{light_id}'")
-                return
-
-        # Otherwise treat as ID
         bridge.set_light(light_id, settings)
         click.echo(f"Scene '{scene}' applied to light {light_id}")
     except Exception as e:
@@ -374,7 +500,7 @@ def scene(ctx, light_id, scene, transition):
 @click.pass_context
 def groups(ctx):
     """List all light groups"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     groups = bridge.get_group()
 
     click.echo("\n=== Light Groups ===")
@@ -392,7 +518,7 @@ def groups(ctx):
 
 
 @cli.command()
-@click.argument("group_id")
+@click.argument("group_id", type=GroupRef())
 @click.option(
     "--transition",
     "-t",
@@ -402,15 +528,8 @@ def groups(ctx):
 @click.pass_context
 def group_on(ctx, group_id, transition):
     """Turn all lights in a group on (use name or ID)"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Check if group_id is a name
-        if not group_id.isdigit():
-            group_id = bridge.get_group_id_by_name(group_id)
-            if not group_id:
-                click.echo(f"Group '{group_id}' not found", err=True)
-                return
-
         kwargs = {}
         if transition:
             kwargs["transitiontime"] = transition
@@ -421,7 +540,7 @@ def group_on(ctx, group_id, transition):
 
 
 @cli.command()
-@click.argument("group_id")
+@click.argument("group_id", type=GroupRef())
 @click.option(
     "--transition",
     "-t",
@@ -431,15 +550,8 @@ def group_on(ctx, group_id, transition):
 @click.pass_context
 def group_off(ctx, group_id, transition):
     """Turn all lights in a group off (use name or ID)"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Check if group_id is a name
-        if not group_id.isdigit():
-            group_id = bridge.get_group_id_by_name(group_id)
-            if not group_id:
-                click.echo(f"Group '{group_id}' not found", err=True)
-                return
-
         kwargs = {}
         if transition:
             kwargs["transitiontime"] = transition
@@ -450,10 +562,8 @@ def group_off(ctx, group_id, transition):
 
 
 @cli.command()
-@click.argument("group_id")
-@click.argument(
-    "scene", type=click.Choice(["relax", "concentrate", "energize", "reading"])
-)
+@click.argument("group_id", type=GroupRef())
+@click.argument("scene", type=click.Choice([*SCENES]))
 @click.option(
     "--transition",
     "-t",
@@ -463,24 +573,10 @@ def group_off(ctx, group_id, transition):
 @click.pass_context
 def group_scene(ctx, group_id, scene, transition):
     """Apply a scene to all lights in a group"""
-    bridge = get_bridge(ctx.obj["ip"])
-
-    scenes = {
-        "relax": {"bri": 144, "ct": 447},
-        "concentrate": {"bri": 219, "ct": 233},
-        "energize": {"bri": 254, "ct": 156},
-        "reading": {"bri": 240, "ct": 346},
-    }
+    bridge = get_bridge(ctx)
 
     try:
-        # Check if group_id is a name
-        if not group_id.isdigit():
-            group_id = bridge.get_group_id_by_name(group_id)
-            if not group_id:
-                click.echo(f"Group '{group_id}' not found", err=True)
-                return
-
-        settings = scenes[scene].copy()
+        settings = SCENES[scene].copy()
         if transition:
             settings["transitiontime"] = transition
 
@@ -496,7 +592,7 @@ def group_scene(ctx, group_id, scene, transition):
 @click.pass_context
 def create_group(ctx, name, lights):
     """Create a new group with specified lights"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
         result = bridge.create_group(name, lights)
         success = next((item for item in result if "success" in item), None)
@@ -510,19 +606,12 @@ def create_group(ctx, name, lights):
 
 
 @cli.command()
-@click.argument("group_id")
+@click.argument("group_id", type=GroupRef())
 @click.pass_context
 def delete_group(ctx, group_id):
     """Delete a group"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Check if group_id is a name
-        if not group_id.isdigit():
-            group_id = bridge.get_group_id_by_name(group_id)
-            if not group_id:
-                click.echo(f"Group '{group_id}' not found", err=True)
-                return
-
         result = bridge.delete_group(group_id)
         click.echo(f"Group {group_id} deleted")
     except Exception as e:
@@ -530,20 +619,12 @@ def delete_group(ctx, group_id):
 
 
 @cli.command()
-@click.argument("light_id")
+@click.argument("light_id", type=LightRef())
 @click.pass_context
 def alert(ctx, light_id):
     """Flash a light once to help identify it"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
-        # Try to interpret as name if not a number
-        if not light_id.isdigit():
-            light = bridge.get_light_objects("name").get(light_id)
-            if light:
-                light.alert = "select"
-                click.echo(f"Light '{light_id}' flashed")
-                return
-
         bridge.set_light(light_id, "alert", "select")
         click.echo(f"Light {light_id} flashed")
     except Exception as e:
@@ -554,7 +635,7 @@ def alert(ctx, light_id):
 @click.pass_context
 def bridge_info(ctx):
     """Get information about the Hue bridge"""
-    bridge = get_bridge(ctx.obj["ip"])
+    bridge = get_bridge(ctx)
     try:
         config = bridge.request("GET", "/api/" + bridge.username + "/config")
         click.echo("\n=== Bridge Information ===")
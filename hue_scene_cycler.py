@@ -4,15 +4,21 @@
 # requires-python = ">=3.12"
 # dependencies = [
 #     "click",
+#     "phue",
 # ]
 # ///
 
 import datetime
-import subprocess
+import sys
 import time
 
 import click
 
+from hue import SCENES, get_bridge, load_config, resolve_group, save_config
+
+# Last scene applied per group ID during this run
+_last_applied = {}
+
 
 @click.command()
 @click.option("--ip", default="192.168.10.121", help="IP address of Hue Bridge")
@@ -27,6 +33,10 @@ def scene_cycler(ip, group, delay, scenes):
     """Cycles through different Hue scenes with a configurable delay."""
     # Parse scenes into a list
     scene_list = scenes.split(",")
+    unknown = [scene for scene in scene_list if scene not in SCENES]
+    if unknown:
+        click.echo(f"Unknown scenes: {', '.join(unknown)}", err=True)
+        return
 
     # Display script info
     click.echo("Hue Scene Cycler")
@@ -39,23 +49,60 @@ def scene_cycler(ip, group, delay, scenes):
     click.echo("Press Ctrl+C to stop")
     click.echo("")
 
+    # Connect once and resolve the group name up front
+    bridge = get_bridge(ip)
     try:
-        # Main loop
+        group_id = int(group) if group.isdigit() else resolve_group(bridge, group)
+    except Exception as e:
+        click.echo(f"Error looking up group '{group}': {e}", err=True)
+        sys.exit(1)
+    if group_id is None:
+        click.echo(f"Group '{group}' not found", err=True)
+        sys.exit(1)
+
+    # Pick up after the scene the previous run left this group on
+    last_scenes = (load_config() or {}).get("last_scenes", {})
+    last_scene = last_scenes.get(str(group_id))
+    index = scene_list.index(last_scene) + 1 if last_scene in scene_list else 0
+
+    try:
+        # Main loop, scheduled against a monotonic deadline so bridge latency
+        # doesn't add up on top of the delay
+        next_tick = time.monotonic()
         while True:
-            for scene in scene_list:
-                apply_scene(ip, group, scene)
-                time.sleep(delay)
+            apply_scene(bridge, group_id, scene_list[index % len(scene_list)])
+            index += 1
+            next_tick += delay
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                # Running behind; skip the missed ticks instead of catching up
+                next_tick = time.monotonic()
     except KeyboardInterrupt:
         click.echo("\nScene cycling stopped by user.")
+    finally:
+        if group_id in _last_applied:
+            last_scenes = {**last_scenes, str(group_id): _last_applied[group_id]}
+            save_config({"last_scenes": last_scenes})
+
 
+def apply_scene(bridge, group_id, scene):
+    """Apply a scene to a Hue group, unless it is already the active one."""
+    if _last_applied.get(group_id) == scene:
+        click.echo(f"Scene {scene} already applied, skipping")
+        click.echo("")
+        return
 
-def apply_scene(ip, group, scene):
-    """Apply a scene to a Hue group."""
     click.echo(f"Applying scene: {scene}")
 
-    # Execute the hue.py command to apply the scene
-    subprocess.run(["./hue.py", "--ip", ip, "group-scene", group, scene])
+    try:
+        bridge.set_group(group_id, SCENES[scene].copy())
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        return
 
+    _last_applied[group_id] = scene
     current_time = datetime.datetime.now().strftime("%H:%M:%S")
     click.echo(f"Applied at {current_time}")
     click.echo("")
@@ -8,11 +8,22 @@
 # ///
 
 import os
+import stat
+import sys
 from pathlib import Path
 
 import click
 
 
+def _lexists(name, dir_fd):
+    """Check whether name exists in dir_fd, counting dangling symlinks."""
+    try:
+        os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+    except FileNotFoundError:
+        return False
+    return True
+
+
 @click.command()
 @click.option(
     "--target-dir",
@@ -49,6 +60,9 @@ def install_links(target_dir, force, dry_run):
         click.echo(f"Creating directory: {target_path}")
         if not dry_run:
             target_path.mkdir(parents=True, exist_ok=True)
+    elif not target_path.is_dir():
+        click.echo(f"Error: {target_path} is not a directory", err=True)
+        sys.exit(1)
 
     # Check if target is in PATH
     if str(target_path) not in os.environ.get("PATH", ""):
@@ -56,14 +70,20 @@ def install_links(target_dir, force, dry_run):
         click.echo(f'Add to your shell profile: export PATH="$PATH:{target_path}"')
 
     # Find all executable Python scripts (excluding tests)
+    # is_file() uses the file type scandir already read; the first stat() is
+    # still one syscall, taking the place of os.access(). Only the owner's
+    # executable bit is checked, while os.access() also honored the group and
+    # other bits for the current user
     scripts = []
-    for script in repo_dir.glob("*.py"):
-        if (
-            script.is_file()
-            and os.access(script, os.X_OK)
-            and not script.name.startswith("test_")
-        ):
-            scripts.append(script)
+    with os.scandir(repo_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.endswith(".py")
+                and not entry.name.startswith("test_")
+                and entry.is_file()
+                and entry.stat().st_mode & stat.S_IXUSR
+            ):
+                scripts.append(Path(entry.path))
 
     if not scripts:
         click.echo("No executable Python scripts found")
@@ -72,33 +92,44 @@ def install_links(target_dir, force, dry_run):
     installed = 0
     skipped = 0
 
-    # Create symlinks
-    for script in scripts:
-        # Use script name without .py extension
-        link_name = script.stem
-        link_path = target_path / link_name
-
-        if link_path.exists() and not force:
-            click.echo(f"Skipping {link_name} (already exists)")
-            skipped += 1
-            continue
-
-        if link_path.exists() and force:
-            if dry_run:
-                click.echo(f"Would remove existing symlink: {link_name}")
-            else:
-                link_path.unlink()
-
-        try:
-            if dry_run:
-                click.echo(f"Would create symlink: {link_name} -> {script}")
-                installed += 1
-            else:
-                link_path.symlink_to(script)
-                click.echo(f"Created symlink: {link_name} -> {script}")
-                installed += 1
-        except Exception as e:
-            click.echo(f"Error creating symlink for {link_name}: {e}")
+    # Open the target directory once and create links relative to it, so
+    # each check, unlink and symlink doesn't walk the full path again. In a
+    # dry run the directory may not exist yet, in which case nothing does.
+    dir_fd = None
+    if not dry_run or target_path.is_dir():
+        dir_fd = os.open(target_path, os.O_RDONLY | os.O_DIRECTORY)
+
+    try:
+        # Create symlinks
+        for script in scripts:
+            # Use script name without .py extension
+            link_name = script.stem
+            exists = dir_fd is not None and _lexists(link_name, dir_fd)
+
+            if exists and not force:
+                click.echo(f"Skipping {link_name} (already exists)")
+                skipped += 1
+                continue
+
+            if exists and force:
+                if dry_run:
+                    click.echo(f"Would remove existing symlink: {link_name}")
+                else:
+                    os.unlink(link_name, dir_fd=dir_fd)
+
+            try:
+                if dry_run:
+                    click.echo(f"Would create symlink: {link_name} -> {script}")
+                    installed += 1
+                else:
+                    os.symlink(script, link_name, dir_fd=dir_fd)
+                    click.echo(f"Created symlink: {link_name} -> {script}")
+                    installed += 1
+            except Exception as e:
+                click.echo(f"Error creating symlink for {link_name}: {e}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
 
     if dry_run:
         click.echo(
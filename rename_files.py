@@ -41,19 +41,22 @@ def rename_files(pattern: str, replacement: str, dir: str, dry_run: bool) -> Non
         click.echo(f"Error: {dir} is not a valid directory", err=True)
         return
 
-    files = [f for f in directory.iterdir() if f.is_file()]
+    with os.scandir(directory) as entries:
+        files = [Path(entry.path) for entry in entries if entry.is_file()]
     if not files:
         click.echo(f"No files found in {dir}")
         return
 
     renamed = 0
+    would_rename = 0
     for file_path in files:
-        if pattern in file_path.name:
-            new_name = file_path.name.replace(pattern, replacement)
+        new_name = file_path.name.replace(pattern, replacement)
+        if new_name != file_path.name:
             new_path = file_path.parent / new_name
 
             if dry_run:
                 click.echo(f"Would rename: {file_path.name} → {new_name}")
+                would_rename += 1
             else:
                 try:
                     file_path.rename(new_path)
@@ -63,9 +66,7 @@ def rename_files(pattern: str, replacement: str, dir: str, dry_run: bool) -> Non
                     click.echo(f"Error renaming {file_path.name}: {e}", err=True)
 
     if dry_run:
-        click.echo(
-            f"\nDry run complete. {len([f for f in files if pattern in f.name])} files would be renamed."
-        )
+        click.echo(f"\nDry run complete. {would_rename} files would be renamed.")
     else:
         click.echo(f"\nRenamed {renamed} files.")
 
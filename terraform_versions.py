@@ -9,84 +9,172 @@
 # ///
 
 import click
+import functools
+import mmap
 import re
 import os
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from colorama import Fore, Style, init
 
 # Initialize colorama
 init(autoreset=True)
 
+# Default number of terraform processes regen_locks runs at once
+REGEN_JOBS = min(16, (os.cpu_count() or 1) * 4)
+
+# Default number of threads update reads and rewrites .tf files with
+UPDATE_JOBS = min(16, (os.cpu_count() or 1) * 4)
+
+# Default number of threads clean_dirs unlinks files with
+UNLINK_JOBS = 16
+
+# terraform init is not safe to run concurrently when a plugin cache
+# (TF_PLUGIN_CACHE_DIR / plugin_cache_dir) is configured, so regen_locks runs
+# one init at a time and only parallelizes providers lock
+_init_lock = threading.Lock()
+
+# Compiled once at import. Files are handled as bytes, so they are never
+# decoded or re-encoded.
+_MODULE_BLOCK_RE = re.compile(rb'^\s*module\s+"', re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
+def _versions_re(provider_names):
+    """Compile one pattern matching required_version or any of the provider blocks"""
+    names = b'|'.join(re.escape(name.encode()) for name in provider_names)
+    return re.compile(rb'(?P<tf>required_version\s*=\s*)"[^"]+"'
+                      rb'|(?P<provider>(?P<name>' + names +
+                      rb')\s*=\s*\{[^}]*version\s*=\s*)"[^"]+"(?P<rest>[^}]*\})',
+                      re.DOTALL)
+
 class TerraformFile:
     def __init__(self, path):
         self.path = Path(path)
-        self.content = self.path.read_text()
         self.modified = False
         self.backup_path = None
 
+    @functools.cached_property
+    def content(self):
+        """Raw file content as bytes, read on first access"""
+        return self.path.read_bytes()
+
+    def mentions(self, *keywords):
+        """Check if the raw file contains any of the keywords, without reading it all in
+
+        On a match the mapped bytes become the content, so the file is not read twice.
+        """
+        with open(self.path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if any(mm.find(keyword.encode()) != -1 for keyword in keywords):
+                    self.content = mm[:]
+                    return True
+                return False
+
     def backup(self):
         """Create a backup of the file"""
-        backup_path = self.path.with_suffix(f"{self.path.suffix}.backup")
-        shutil.copy2(self.path, backup_path)
+        # Plain string concatenation; with_suffix() would reparse the path
+        backup_path = Path(f"{self.path}.backup")
+        backup_path.unlink(missing_ok=True)
+        try:
+            # A hard link copies no data; save() writes a new file, so it stays intact.
+            # Link the resolved path, as save() does, so a symlink's target is backed up
+            os.link(os.path.realpath(self.path), backup_path)
+        except OSError:
+            # Not supported by the filesystem, or across devices
+            shutil.copy2(self.path, backup_path)
         self.backup_path = backup_path
         return backup_path
 
-    def update_terraform_version(self, version_constraint):
-        """Update the Terraform required_version constraint"""
-        pattern = r'(required_version\s*=\s*)"([^"]+)"'
-        replacement = fr'\1"{version_constraint}"'
-        new_content = re.sub(pattern, replacement, self.content)
-        if new_content != self.content:
-            self.content = new_content
-            self.modified = True
-            return True
-        return False
+    def update_versions(self, version_constraint, provider_versions):
+        """Update required_version and the given providers' constraints in a single pass
+
+        provider_versions maps provider names to constraints. Returns whether
+        required_version changed and the set of providers whose constraint changed.
+        """
+        if b'required_version' not in self.content and not any(
+                name.encode() in self.content for name in provider_versions):
+            return False, set()
 
-    def update_provider_version(self, provider_name, version_constraint):
-        """Update the provider version constraint"""
-        # Pattern for standard provider block format
-        pattern = fr'({provider_name}\s*=\s*\{{[^}}]*version\s*=\s*)"([^"]+)"([^}}]*\}})'
-        replacement = fr'\1"{version_constraint}"\3'
+        tf_value = b'"' + version_constraint.encode() + b'"'
+        provider_values = {name.encode(): b'"' + constraint.encode() + b'"'
+                           for name, constraint in provider_versions.items()}
+        changed = set()
 
-        new_content = re.sub(pattern, replacement, self.content, flags=re.DOTALL)
-        if new_content != self.content:
-            self.content = new_content
+        def replace(match):
+            if match['tf'] is not None:
+                key, new = None, match['tf'] + tf_value
+            else:
+                key = match['name']
+                new = match['provider'] + provider_values[key] + match['rest']
+            if new != match[0]:
+                changed.add(key)
+            return new
+
+        pattern = _versions_re(tuple(provider_versions))
+        self.content = pattern.sub(replace, self.content)
+        if changed:
             self.modified = True
-            return True
-        return False
+        return None in changed, {name.decode() for name in changed - {None}}
 
     def save(self):
         """Save changes to the file"""
         if self.modified:
-            self.path.write_text(self.content)
+            # Replace the file rather than rewriting it in place, which also
+            # updates every hard link to it (including the backup)
+            path = Path(os.path.realpath(self.path))
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_bytes(self.content)
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
             return True
         return False
 
 def is_inside_terraform_dir(path):
     """Check if a path is inside a .terraform directory"""
-    return '.terraform' in path.parts
+    # Wrapping in separators lets one substring search match any component
+    return f'{os.sep}.terraform{os.sep}' in f'{os.sep}{path}{os.sep}'
+
+def _walk(root, max_depth=None):
+    """Yield (depth, entry) for everything under root, without descending into .terraform directories"""
+    stack = [(os.fspath(root), 0)]
+    while stack:
+        dir_path, depth = stack.pop()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    yield depth, entry
+                    if (entry.name != '.terraform'
+                            and (max_depth is None or depth < max_depth)
+                            and entry.is_dir(follow_symlinks=False)):
+                        stack.append((entry.path, depth + 1))
+        except OSError:
+            # Unreadable or missing directories are skipped, like glob does
+            continue
 
 def find_terraform_files(path, recursive=False):
     """Find all .tf files in the given path, excluding those inside .terraform directories"""
     path = Path(path)
-    if recursive:
-        all_files = path.glob('**/*.tf')
-        return [f for f in all_files if not is_inside_terraform_dir(f)]
-    else:
-        return [f for f in path.glob('*.tf') if not is_inside_terraform_dir(f)]
+    if is_inside_terraform_dir(path):
+        return []
+    return [Path(entry.path) for _, entry in _walk(path, None if recursive else 0)
+            if entry.name.endswith('.tf') and entry.is_file()]
 
 def find_lock_files(path, recursive=False):
     """Find all .terraform.lock.hcl files in the given path, excluding those inside .terraform directories"""
     path = Path(path)
-    if recursive:
-        all_files = path.glob('**/.terraform.lock.hcl')
-        return [f for f in all_files if not is_inside_terraform_dir(f)]
-    else:
-        # For non-recursive mode, we still need to look in immediate subdirectories for lock files
-        return [f for f in path.glob('*/.terraform.lock.hcl') if not is_inside_terraform_dir(f)]
+    if is_inside_terraform_dir(path):
+        return []
+    # For non-recursive mode, we still need to look in immediate subdirectories for lock files
+    return [Path(entry.path) for depth, entry in _walk(path, None if recursive else 1)
+            if entry.name == '.terraform.lock.hcl' and (recursive or depth == 1)
+            and entry.is_file()]
 
 def find_terraform_modules(path, recursive=False):
     """Find directories containing .tf files, excluding .terraform directories"""
@@ -96,41 +184,169 @@ def find_terraform_modules(path, recursive=False):
 
 def find_terraform_dirs(path, recursive=False):
     """Find .terraform directories in the given path"""
+    # _walk yields .terraform directories but never descends into them, so their
+    # (often large) provider and module trees are not enumerated. For non-recursive
+    # mode, look in the current directory and immediate subdirectories.
+    return [Path(entry.path) for depth, entry in _walk(Path(path), None if recursive else 1)
+            if entry.name == '.terraform' and entry.is_dir(follow_symlinks=False)]
+
+def scan_repo(path, recursive=False):
+    """Find .tf files, lock files, module directories and .terraform directories in one walk
+
+    Gives the same results as the find_* functions, for callers that need several of them.
+    """
     path = Path(path)
-    if recursive:
-        # Searching for .terraform directories
-        return list(path.glob('**/.terraform'))
-    else:
-        # For non-recursive mode, look in the current directory and immediate subdirectories
-        dirs = list(path.glob('.terraform'))
-        dirs.extend(path.glob('*/.terraform'))
-        return dirs
+    scan = {'tf_files': [], 'lock_files': [], 'modules': set(), 'tf_dirs': []}
+    inside_terraform_dir = is_inside_terraform_dir(path)
+    for depth, entry in _walk(path, None if recursive else 1):
+        if entry.name == '.terraform':
+            if entry.is_dir(follow_symlinks=False):
+                scan['tf_dirs'].append(Path(entry.path))
+        elif inside_terraform_dir:
+            continue
+        elif entry.name.endswith('.tf'):
+            if (recursive or depth == 0) and entry.is_file():
+                tf_file = Path(entry.path)
+                scan['tf_files'].append(tf_file)
+                scan['modules'].add(tf_file.parent)
+        elif entry.name == '.terraform.lock.hcl':
+            if (recursive or depth == 1) and entry.is_file():
+                scan['lock_files'].append(Path(entry.path))
+    return scan
 
 def has_lock_file(dir_path):
     """Check if a directory has a .terraform.lock.hcl file"""
     lock_file = dir_path / ".terraform.lock.hcl"
     return lock_file.exists()
 
-def run_terraform_command(command, cwd=None, capture_output=True):
-    """Run a terraform command and return the result"""
+def _remove_tree(path, jobs=UNLINK_JOBS, size=True):
+    """Remove the directory tree at path and return the size in bytes of the files removed
+
+    Files are unlinked from a thread pool so the syscalls overlap, then the emptied
+    directories are removed bottom-up. Symlinks are removed, not followed. With
+    size=False, files are not stat()ed and 0 is returned.
+    """
+    total = 0
+    files = []
+    dirs = []
+    stack = [os.fspath(path)]
+    while stack:
+        dir_path = stack.pop()
+        dirs.append(dir_path)
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    if size and entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    files.append(entry.path)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        # Consuming the results re-raises the first unlink error
+        for _ in executor.map(os.unlink, files):
+            pass
+    # Parents were listed before their children, so reversed order empties each
+    # directory before removing it
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
+    return total
+
+def run_terraform_command(command, cwd=None, capture_output=True, quiet=False):
+    """Run a terraform command and return the result
+
+    With quiet=True, stdout is discarded without passing through Python, and only
+    stderr is captured for the error message.
+    """
+    if quiet:
+        streams = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE}
+    else:
+        streams = {'capture_output': capture_output}
     try:
         result = subprocess.run(
             command,
             cwd=cwd,
-            capture_output=capture_output,
             text=True,
-            check=True
+            check=True,
+            **streams
         )
-        return True, result.stdout if capture_output else ""
+        return True, result.stdout or ""
     except subprocess.CalledProcessError as e:
-        return False, f"Error: {e.stderr}" if capture_output else f"Error: Command failed with code {e.returncode}"
+        return False, f"Error: {e.stderr}" if e.stderr is not None else f"Error: Command failed with code {e.returncode}"
 
 def validate_terraform_file(file_path):
     """Validate a Terraform file using terraform validate"""
     cwd = file_path.parent
-    success, output = run_terraform_command(["terraform", "fmt", "-check", file_path.name], cwd=cwd)
+    success, output = run_terraform_command(["terraform", "fmt", "-check", file_path.name], cwd=cwd, quiet=True)
     return success
 
+def validate_terraform_files(file_paths):
+    """Check formatting of several files with one terraform fmt run per directory
+
+    Returns a dict mapping each file to whether it passed. `fmt -check -list=true`
+    names the unformatted files on stdout; if fmt fails for any other reason (e.g. a
+    syntax error), that directory falls back to checking its files one at a time.
+    """
+    by_dir = {}
+    for file_path in file_paths:
+        by_dir.setdefault(file_path.parent, []).append(file_path)
+
+    results = {}
+    for dir_path, files in by_dir.items():
+        result = subprocess.run(
+            ["terraform", f"-chdir={dir_path}", "fmt", "-check", "-list=true"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0 or not result.stderr.strip():
+            unformatted = set(result.stdout.splitlines())
+            for file_path in files:
+                results[file_path] = file_path.name not in unformatted
+        else:
+            for file_path in files:
+                results[file_path] = validate_terraform_file(file_path)
+    return results
+
+def _update_file(file_path, tf_version, aws_version, dry_run, backup):
+    """Update the version constraints in one file.
+
+    Runs in a worker thread, so messages are collected and returned for the caller
+    to print together with whether the file was modified.
+    """
+    messages = []
+    saved = False
+    try:
+        tf_file = TerraformFile(file_path)
+        # Provider constraints only appear in required_providers blocks. Most files
+        # have neither that nor required_version, so skip reading those
+        if not tf_file.mentions('required_version', 'required_providers'):
+            return saved, messages
+        terraform_updated, updated_providers = tf_file.update_versions(tf_version, {"aws": aws_version})
+        aws_updated = "aws" in updated_providers
+
+        if terraform_updated or aws_updated:
+            if dry_run:
+                messages.append(f"{Fore.GREEN}Would update: {file_path}")
+                return saved, messages
+
+            if backup:
+                backup_path = tf_file.backup()
+                messages.append(f"{Fore.BLUE}Created backup: {backup_path}")
+
+            saved = tf_file.save()
+
+            updates = []
+            if terraform_updated:
+                updates.append(f"Terraform version to {tf_version}")
+            if aws_updated:
+                updates.append(f"AWS provider version to {aws_version}")
+
+            messages.append(f"{Fore.GREEN}Updated {file_path}: {', '.join(updates)}")
+
+    except Exception as e:
+        messages.append(f"{Fore.RED}Error processing {file_path}: {str(e)}")
+
+    return saved, messages
+
 @click.group()
 def cli():
     """Terraform version updater and lock file manager."""
@@ -144,9 +360,12 @@ def cli():
 @click.option('--dry-run', is_flag=True, help='Preview changes without applying them')
 @click.option('--backup', is_flag=True, help='Create backups before making changes')
 @click.option('--validate', is_flag=True, help='Validate files after modification')
-def update(path, recursive, tf_version, aws_version, dry_run, backup, validate):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=UPDATE_JOBS, show_default=True,
+              help='Number of files to process in parallel')
+def update(path, recursive, tf_version, aws_version, dry_run, backup, validate, jobs=UPDATE_JOBS,
+           scan=None):
     """Update Terraform version constraints in .tf files."""
-    tf_files = find_terraform_files(path, recursive)
+    tf_files = scan['tf_files'] if scan else find_terraform_files(path, recursive)
 
     if not tf_files:
         click.echo(f"{Fore.YELLOW}No Terraform files found in {path}" +
@@ -155,42 +374,41 @@ def update(path, recursive, tf_version, aws_version, dry_run, backup, validate):
 
     click.echo(f"{Fore.CYAN}Found {len(tf_files)} Terraform files")
 
-    modified_files = []
-
+    # Files are independent, so read and rewrite them in parallel, and report in
+    # the original order from the main thread. Paths that resolve to the same file
+    # (e.g. symlinks to a shared versions.tf) go to one worker, which handles them
+    # in order, so the first one updates the file and the rest find nothing to do
+    by_realpath = {}
     for file_path in tf_files:
-        try:
-            tf_file = TerraformFile(file_path)
-            terraform_updated = tf_file.update_terraform_version(tf_version)
-            aws_updated = tf_file.update_provider_version("aws", aws_version)
-
-            if terraform_updated or aws_updated:
-                if dry_run:
-                    click.echo(f"{Fore.GREEN}Would update: {file_path}")
-                    continue
-
-                if backup:
-                    backup_path = tf_file.backup()
-                    click.echo(f"{Fore.BLUE}Created backup: {backup_path}")
+        by_realpath.setdefault(os.path.realpath(file_path), []).append(file_path)
 
-                tf_file.save()
-                modified_files.append(file_path)
+    def process(file_paths):
+        return [_update_file(file_path, tf_version, aws_version, dry_run, backup)
+                for file_path in file_paths]
 
-                updates = []
-                if terraform_updated:
-                    updates.append(f"Terraform version to {tf_version}")
-                if aws_updated:
-                    updates.append(f"AWS provider version to {aws_version}")
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for file_paths, results in zip(by_realpath.values(),
+                                       executor.map(process, by_realpath.values())):
+            outcomes.update(zip(file_paths, results))
 
-                click.echo(f"{Fore.GREEN}Updated {file_path}: {', '.join(updates)}")
-
-                if validate:
-                    if validate_terraform_file(file_path):
-                        click.echo(f"{Fore.GREEN}✓ Validation passed for {file_path}")
-                    else:
-                        click.echo(f"{Fore.RED}✗ Validation failed for {file_path}")
+    modified_files = []
+    for file_path in tf_files:
+        modified, messages = outcomes[file_path]
+        for message in messages:
+            click.echo(message)
+        if modified:
+            modified_files.append(file_path)
 
+    if validate and modified_files:
+        try:
+            for file_path, passed in validate_terraform_files(modified_files).items():
+                if passed:
+                    click.echo(f"{Fore.GREEN}✓ Validation passed for {file_path}")
+                else:
+                    click.echo(f"{Fore.RED}✗ Validation failed for {file_path}")
         except Exception as e:
-            click.echo(f"{Fore.RED}Error processing {file_path}: {str(e)}")
+            click.echo(f"{Fore.RED}Error validating files: {str(e)}")
 
     click.echo(f"{Fore.CYAN}Summary: Modified {len(modified_files)} files")
 
@@ -200,9 +418,9 @@ def update(path, recursive, tf_version, aws_version, dry_run, backup, validate):
 @click.option('--dry-run', is_flag=True, help='Preview changes without applying them')
 @click.option('--backup', is_flag=True, help='Create backups before deletion')
 @click.confirmation_option(prompt='Are you sure you want to remove the lock files?')
-def clean_locks(path, recursive, dry_run, backup):
+def clean_locks(path, recursive, dry_run, backup, scan=None):
     """Remove Terraform lock files."""
-    lock_files = find_lock_files(path, recursive)
+    lock_files = scan['lock_files'] if scan else find_lock_files(path, recursive)
 
     if not lock_files:
         click.echo(f"{Fore.YELLOW}No lock files found in {path}" +
@@ -220,11 +438,12 @@ def clean_locks(path, recursive, dry_run, backup):
                 continue
 
             if backup:
-                backup_path = file_path.with_suffix('.hcl.backup')
-                shutil.copy2(file_path, backup_path)
+                # The lock file is removed right after, so just move it aside
+                backup_path = Path(f"{file_path}.backup")
+                file_path.replace(backup_path)
                 click.echo(f"{Fore.BLUE}Created backup: {backup_path}")
-
-            file_path.unlink()
+            else:
+                file_path.unlink()
             removed_files.append(file_path)
             click.echo(f"{Fore.GREEN}Removed: {file_path}")
 
@@ -237,10 +456,13 @@ def clean_locks(path, recursive, dry_run, backup):
 @click.option('--path', '-p', default='.', help='Path to search for .terraform directories')
 @click.option('--recursive', '-r', is_flag=True, help='Search for directories recursively')
 @click.option('--dry-run', is_flag=True, help='Preview changes without applying them')
+@click.option('--size/--no-size', default=True, help='Report the disk space freed (default: on)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=UNLINK_JOBS, show_default=True,
+              help='Number of files to delete in parallel')
 @click.confirmation_option(prompt='Are you sure you want to remove the .terraform directories?')
-def clean_dirs(path, recursive, dry_run):
+def clean_dirs(path, recursive, dry_run, size=True, jobs=UNLINK_JOBS, scan=None):
     """Remove .terraform directories."""
-    tf_dirs = find_terraform_dirs(path, recursive)
+    tf_dirs = scan['tf_dirs'] if scan else find_terraform_dirs(path, recursive)
 
     if not tf_dirs:
         click.echo(f"{Fore.YELLOW}No .terraform directories found in {path}" +
@@ -258,15 +480,11 @@ def clean_dirs(path, recursive, dry_run):
                 click.echo(f"{Fore.GREEN}Would remove: {dir_path}")
                 continue
 
-            # Calculate directory size before removal
-            total_size = sum(f.stat().st_size for f in dir_path.glob('**/*') if f.is_file())
-            size_mb = total_size / (1024 * 1024)
-
-            # Remove the directory
-            shutil.rmtree(dir_path)
+            # Remove the directory, totalling file sizes during the same walk
+            size_mb = _remove_tree(dir_path, jobs, size) / (1024 * 1024)
 
             removed_dirs.append((dir_path, size_mb))
-            click.echo(f"{Fore.GREEN}Removed: {dir_path} ({size_mb:.2f} MB)")
+            click.echo(f"{Fore.GREEN}Removed: {dir_path}" + (f" ({size_mb:.2f} MB)" if size else ""))
 
         except Exception as e:
             failed_dirs.append((dir_path, str(e)))
@@ -275,14 +493,96 @@ def clean_dirs(path, recursive, dry_run):
     # Print summary
     click.echo(f"\n{Fore.CYAN}Summary:")
 
-    total_size_removed = sum(size for _, size in removed_dirs)
-    click.echo(f"{Fore.GREEN}Successfully removed {len(removed_dirs)} directories ({total_size_removed:.2f} MB total)")
+    total_size_removed = sum(mb for _, mb in removed_dirs)
+    click.echo(f"{Fore.GREEN}Successfully removed {len(removed_dirs)} directories" +
+               (f" ({total_size_removed:.2f} MB total)" if size else ""))
 
     if failed_dirs:
         click.echo(f"{Fore.RED}Failed to remove {len(failed_dirs)} directories")
         for dir_path, error in failed_dirs:
             click.echo(f"{Fore.RED}  - {dir_path}: {error}")
 
+def _needs_module_install(dir_path):
+    """Check if dir_path calls modules that terraform init has not installed yet"""
+    if (dir_path / '.terraform' / 'modules').is_dir():
+        return False
+    for tf_file in find_terraform_files(dir_path):
+        try:
+            if _MODULE_BLOCK_RE.search(tf_file.read_bytes()):
+                return True
+        except OSError:
+            continue
+    return False
+
+def _regen_lock_file(dir_path, platform_args, verbose):
+    """Regenerate the lock file in dir_path, initializing Terraform first if needed.
+
+    Runs in a worker thread, so messages are collected and returned for the caller
+    to print together with (success, error).
+    """
+    # -chdir runs terraform against dir_path without changing the working directory
+    command = ["terraform", f"-chdir={dir_path}", "providers", "lock", *platform_args]
+    init_command = ["terraform", f"-chdir={dir_path}", "init", "-backend=false"]
+    messages = [f"{Fore.CYAN}Processing: {dir_path}"]
+
+    def initialize():
+        """Run terraform init, returning (success, output)"""
+        with _init_lock:
+            success_init, output_init = run_terraform_command(init_command, quiet=not verbose)
+        if not success_init:
+            messages.append(f"{Fore.RED}Failed to initialize Terraform in {dir_path}")
+            if verbose:
+                messages.append(f"{Fore.RED}Initialization error output: \n{output_init}")
+        # Show initialization output if verbose
+        elif verbose and output_init.strip():
+            messages.append(f"{Fore.GREEN}Initialization output: \n{output_init.strip()}")
+        return success_init, output_init
+
+    # providers lock always fails on modules that aren't installed, so initialize
+    # up front instead of paying for a failed run first
+    initialized = _needs_module_install(dir_path)
+    if initialized:
+        messages.append(f"{Fore.YELLOW}Modules are not installed. Initializing first...")
+        success_init, output_init = initialize()
+        if not success_init:
+            return False, f"Initialization failed: {output_init}", messages
+
+    # Run terraform providers lock with the specified platforms
+    messages.append(f"{Fore.BLUE}Running: {' '.join(command)}")
+    success, output = run_terraform_command(command, quiet=not verbose)
+
+    if success:
+        suffix = " after initialization" if initialized else ""
+        messages.append(f"{Fore.GREEN}Successfully regenerated lock file in {dir_path}{suffix}")
+        if verbose and output.strip():
+            messages.append(f"{Fore.GREEN}Output: \n{output.strip()}")
+        return True, None, messages
+
+    if not initialized:
+        # Show the error output if verbose mode is enabled
+        if verbose:
+            messages.append(f"{Fore.RED}Error output: \n{output}")
+
+        messages.append(f"{Fore.YELLOW}Failed to regenerate lock file. Trying to initialize first...")
+
+        success_init, output_init = initialize()
+        if not success_init:
+            return False, f"Initialization failed: {output_init}", messages
+
+        # Try again after initialization
+        success, output = run_terraform_command(command, quiet=not verbose)
+
+        if success:
+            messages.append(f"{Fore.GREEN}Successfully regenerated lock file in {dir_path} after initialization")
+            if verbose and output.strip():
+                messages.append(f"{Fore.GREEN}Output: \n{output.strip()}")
+            return True, None, messages
+
+    messages.append(f"{Fore.RED}Failed to regenerate lock file in {dir_path} even after initialization")
+    if verbose:
+        messages.append(f"{Fore.RED}Error output: \n{output}")
+    return False, output, messages
+
 @cli.command()
 @click.option('--path', '-p', default='.', help='Path to Terraform root modules')
 @click.option('--recursive', '-r', is_flag=True, help='Search for Terraform modules recursively')
@@ -290,13 +590,19 @@ def clean_dirs(path, recursive, dry_run):
               help='Comma-separated list of platforms to lock')
 @click.option('--force', '-f', is_flag=True, help='Force regeneration even if lock files already exist')
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed error messages')
-def regen_locks(path, recursive, platforms, force, verbose):
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=REGEN_JOBS, show_default=True,
+              help='Number of directories to process in parallel; terraform init still runs '
+                   'one directory at a time, as the plugin cache is not safe for concurrent use')
+def regen_locks(path, recursive, platforms, force, verbose, jobs=REGEN_JOBS, scan=None):
     """Regenerate Terraform lock files with specific platforms."""
     # Convert path to absolute path
     path = Path(path).absolute()
 
     # Find directories containing .tf files
-    tf_dirs = find_terraform_modules(path, recursive)
+    if scan:
+        tf_dirs = {dir_path.absolute() for dir_path in scan['modules']}
+    else:
+        tf_dirs = find_terraform_modules(path, recursive)
 
     if not tf_dirs:
         click.echo(f"{Fore.YELLOW}No Terraform module directories found in {path}" +
@@ -315,61 +621,33 @@ def regen_locks(path, recursive, platforms, force, verbose):
     skipped_dirs = []
     failed_dirs = []
 
+    # Visit directories in inode order, which tends to follow on-disk layout and
+    # keeps reads of the .tf and lock files sequential on a cold cache
+    tf_dirs = sorted(tf_dirs, key=lambda dir_path: os.stat(dir_path).st_ino)
+
+    pending_dirs = []
     for dir_path in tf_dirs:
         # Check if lockfile exists and decide whether to process this directory
         if has_lock_file(dir_path) and not force:
             skipped_dirs.append(dir_path)
             click.echo(f"{Fore.YELLOW}Skipping {dir_path}: Lock file already exists (use --force to override)")
             continue
-
-        click.echo(f"{Fore.CYAN}Processing: {dir_path}")
-
-        # Run terraform providers lock with the specified platforms
-        command = ["terraform", "providers", "lock"]
-        command.extend(platform_args)
-
-        click.echo(f"{Fore.BLUE}Running: {' '.join(command)}")
-        success, output = run_terraform_command(command, cwd=dir_path, capture_output=True)
-
-        if success:
-            successful_dirs.append(dir_path)
-            click.echo(f"{Fore.GREEN}Successfully regenerated lock file in {dir_path}")
-            if verbose and output.strip():
-                click.echo(f"{Fore.GREEN}Output: \n{output.strip()}")
-        else:
-            # Show the error output if verbose mode is enabled
-            if verbose:
-                click.echo(f"{Fore.RED}Error output: \n{output}")
-
-            click.echo(f"{Fore.YELLOW}Failed to regenerate lock file. Trying to initialize first...")
-
-            # Try initialization with verbose output if requested
-            success_init, output_init = run_terraform_command(["terraform", "init", "-backend=false"], cwd=dir_path, capture_output=True)
-
-            if not success_init:
-                failed_dirs.append((dir_path, f"Initialization failed: {output_init}"))
-                click.echo(f"{Fore.RED}Failed to initialize Terraform in {dir_path}")
-                if verbose:
-                    click.echo(f"{Fore.RED}Initialization error output: \n{output_init}")
-                continue
-
-            # Show initialization output if verbose
-            if verbose and output_init.strip():
-                click.echo(f"{Fore.GREEN}Initialization output: \n{output_init.strip()}")
-
-            # Try again after initialization
-            success_retry, output_retry = run_terraform_command(command, cwd=dir_path, capture_output=True)
-
-            if success_retry:
+        pending_dirs.append(dir_path)
+
+    # terraform spends most of its time waiting on the registry, so run several
+    # directories at once and report each one from the main thread as it finishes
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_regen_lock_file, dir_path, platform_args, verbose): dir_path
+                   for dir_path in pending_dirs}
+        for future in as_completed(futures):
+            dir_path = futures[future]
+            success, error, messages = future.result()
+            for message in messages:
+                click.echo(message)
+            if success:
                 successful_dirs.append(dir_path)
-                click.echo(f"{Fore.GREEN}Successfully regenerated lock file in {dir_path} after initialization")
-                if verbose and output_retry.strip():
-                    click.echo(f"{Fore.GREEN}Output: \n{output_retry.strip()}")
             else:
-                failed_dirs.append((dir_path, output_retry))
-                click.echo(f"{Fore.RED}Failed to regenerate lock file in {dir_path} even after initialization")
-                if verbose:
-                    click.echo(f"{Fore.RED}Error output: \n{output_retry}")
+                failed_dirs.append((dir_path, error))
 
     # Print summary
     click.echo(f"\n{Fore.CYAN}Summary:")
@@ -398,22 +676,27 @@ def regen_locks(path, recursive, platforms, force, verbose):
 @click.confirmation_option(prompt='This will update version constraints, remove lock files, and regenerate them. Continue?')
 def run_all(path, recursive, tf_version, aws_version, backup, platforms, force_regen, clean_tf_dirs, verbose):
     """Execute all steps: update versions, clean .terraform directories (optional), clean locks, and regenerate locks."""
+    # Walk the tree once and share the results between the steps. Cleaning
+    # .terraform directories doesn't change which files or modules exist, and
+    # regen_locks checks for lock files itself.
+    scan = scan_repo(path, recursive)
+
     click.echo(f"{Fore.CYAN}Step 1: Updating version constraints")
     ctx = click.Context(update, info_name='update')
-    update.callback(path, recursive, tf_version, aws_version, False, backup, False)
+    update.callback(path, recursive, tf_version, aws_version, False, backup, False, scan=scan)
 
     if clean_tf_dirs:
         click.echo(f"\n{Fore.CYAN}Step 2: Cleaning .terraform directories")
         ctx = click.Context(clean_dirs, info_name='clean-dirs')
-        clean_dirs.callback(path, recursive, False)
+        clean_dirs.callback(path, recursive, False, scan=scan)
 
     click.echo(f"\n{Fore.CYAN}Step {'3' if clean_tf_dirs else '2'}: Cleaning lock files")
     ctx = click.Context(clean_locks, info_name='clean-locks')
-    clean_locks.callback(path, recursive, False, backup)
+    clean_locks.callback(path, recursive, False, backup, scan=scan)
 
     click.echo(f"\n{Fore.CYAN}Step {'4' if clean_tf_dirs else '3'}: Regenerating lock files")
     ctx = click.Context(regen_locks, info_name='regen-locks')
-    regen_locks.callback(path, recursive, platforms, force_regen, verbose)
+    regen_locks.callback(path, recursive, platforms, force_regen, verbose, scan=scan)
 
     click.echo(f"\n{Fore.GREEN}All steps completed!")
 
@@ -0,0 +1,186 @@
+#!/usr/bin/env -S uv run --script
+
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "click",
+#     "pytest",
+# ]
+# ///
+
+import configparser
+import os
+import sys
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from aws_config_merge import load_aws_config, main, merge_configs, parse_ini
+
+BASE_CONFIG = """# Base config
+[default]
+region = eu-west-1
+s3 =
+    max_concurrent_requests = 20
+
+[profile dev]
+sso_start_url = https://example.awsapps.com/start#/
+region = eu-west-1
+"""
+
+
+@pytest.fixture
+def config_files(tmp_path):
+    """Create a base AWS config and a config to merge into it."""
+    base = tmp_path / "config"
+    base.write_text(BASE_CONFIG)
+    new = tmp_path / "new_config"
+    new.write_text(
+        "[profile dev]\nregion = us-east-1\n\n[profile prod]\nregion = eu-north-1\n"
+    )
+    return base, new
+
+
+def test_parse_ini_sections_and_values():
+    """Test parsing of sections, values and comments."""
+    config = parse_ini(BASE_CONFIG)
+    assert list(config) == ["default", "profile dev"]
+    assert config["profile dev"]["sso_start_url"] == (
+        "https://example.awsapps.com/start#/"
+    )
+
+
+def test_parse_ini_continuation_lines():
+    """Test nested settings are kept as multi-line values."""
+    config = parse_ini(BASE_CONFIG)
+    assert config["default"]["s3"] == "\nmax_concurrent_requests = 20"
+
+
+def test_parse_ini_continuation_with_comment_and_blank_line():
+    """Test comments and blank lines inside a value don't end it, as in ConfigParser."""
+    text = (
+        "[default]\n"
+        "s3 =\n"
+        "    max_concurrent_requests = 20\n"
+        "# tuned for large uploads\n"
+        "\n"
+        "    multipart_threshold = 64MB\n"
+        "\n"
+        "region = eu-west-1\n"
+    )
+    parser = configparser.ConfigParser()
+    parser.read_string(text)
+
+    config = parse_ini(text)
+    assert config["default"]["s3"] == parser["default"]["s3"]
+    assert config["default"]["s3"] == (
+        "\nmax_concurrent_requests = 20\n\nmultipart_threshold = 64MB"
+    )
+    assert config["default"]["region"] == "eu-west-1"
+
+
+def test_parse_ini_colon_delimiter_and_key_case():
+    """Test `key: value` pairs are accepted and keys are lowercased."""
+    config = parse_ini("[default]\nRegion: eu-west-1\nsso_start_url = https://x\n")
+    assert config["default"] == {"region": "eu-west-1", "sso_start_url": "https://x"}
+
+
+def test_parse_ini_key_outside_section():
+    """Test a key before any section header is rejected."""
+    with pytest.raises(ValueError):
+        parse_ini("region = eu-west-1\n")
+
+
+def test_parse_ini_missing_delimiter():
+    """Test a line without `=` or `:` is rejected rather than kept as a key."""
+    with pytest.raises(ValueError, match="Line 2"):
+        parse_ini("[default]\nregion eu-west-1\n")
+
+
+def test_parse_ini_header_with_trailing_comment():
+    """Test text after a section header's closing bracket is ignored."""
+    config = parse_ini("[profile dev] # comment\nregion = eu-west-1\n")
+    assert config == {"profile dev": {"region": "eu-west-1"}}
+
+
+def test_merge_configs_new_takes_precedence():
+    """Test keys from the new config override the base config."""
+    merged = merge_configs(
+        {"default": {"region": "eu-west-1", "output": "json"}},
+        {"default": {"region": "us-east-1"}, "profile prod": {"region": "eu-north-1"}},
+    )
+    assert merged == {
+        "default": {"region": "us-east-1", "output": "json"},
+        "profile prod": {"region": "eu-north-1"},
+    }
+
+
+def test_merge_configs_keys_case_insensitive():
+    """Test a key overrides the base key regardless of case."""
+    merged = merge_configs(
+        parse_ini("[default]\nRegion = eu-west-1\n"),
+        parse_ini("[default]\nregion = us-east-1\n"),
+    )
+    assert merged == {"default": {"region": "us-east-1"}}
+
+
+def test_main_in_place(config_files):
+    """Test merging a config file into the AWS config in place."""
+    base, new = config_files
+    runner = CliRunner()
+    result = runner.invoke(main, [str(new), "-c", str(base)])
+
+    assert result.exit_code == 0
+    merged = parse_ini(base.read_text())
+    assert merged["profile dev"]["region"] == "us-east-1"
+    assert merged["profile prod"]["region"] == "eu-north-1"
+    assert merged["default"]["s3"] == "\nmax_concurrent_requests = 20"
+
+
+def test_main_empty_base_config(config_files):
+    """Test merging into an empty AWS config file."""
+    base, new = config_files
+    base.write_text("")
+    runner = CliRunner()
+    result = runner.invoke(main, [str(new), "-c", str(base), "--no-in-place"])
+
+    assert result.exit_code == 0
+    assert "[profile prod]\nregion = eu-north-1" in result.output
+
+
+def test_load_aws_config_from_fifo(tmp_path):
+    """Test a non-regular file such as a pipe is read rather than mapped."""
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+    writer = threading.Thread(
+        target=fifo.write_text, args=("[default]\nregion = us-east-1\n",)
+    )
+    writer.start()
+    try:
+        config = load_aws_config(str(fifo))
+    finally:
+        writer.join()
+
+    assert config == {"default": {"region": "us-east-1"}}
+
+
+def test_main_stdin_to_stdout(config_files):
+    """Test reading the new config from stdin and writing to stdout."""
+    base, _ = config_files
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["-c", str(base), "--no-in-place", "--stdin"],
+        input="[profile dev]\nregion = us-east-1\n",
+    )
+
+    assert result.exit_code == 0
+    assert "[profile dev]\nsso_start_url" in result.output
+    assert "region = us-east-1" in result.output
+    assert base.read_text() == BASE_CONFIG
+
+
+if __name__ == "__main__":
+    # Run pytest when this script is executed directly
+    sys.exit(pytest.main(["-v", __file__]))
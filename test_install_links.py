@@ -0,0 +1,46 @@
+#!/usr/bin/env -S uv run --script
+
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "click",
+#     "pytest",
+# ]
+# ///
+
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from install_links import install_links
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_target_not_a_directory(tmp_path, monkeypatch, dry_run):
+    """Test a target that is not a directory is reported without linking anything."""
+    target = tmp_path / "not_a_dir"
+    target.write_text("")
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    args = ["-t", str(target)] + (["--dry-run"] if dry_run else [])
+    result = runner.invoke(install_links, args)
+
+    assert result.exit_code == 1
+    assert f"Error: {target} is not a directory" in result.output
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["not_a_dir"]
+
+
+def test_creates_links(tmp_path):
+    """Test executable scripts are linked without their .py extension."""
+    runner = CliRunner()
+    result = runner.invoke(install_links, ["-t", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "install_links").is_symlink()
+    assert not (tmp_path / "test_install_links").exists()
+
+
+if __name__ == "__main__":
+    # Run pytest when this script is executed directly
+    sys.exit(pytest.main(["-v", __file__]))
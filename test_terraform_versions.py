@@ -0,0 +1,228 @@
+#!/usr/bin/env -S uv run --script
+
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "click",
+#     "colorama",
+#     "pytest",
+# ]
+# ///
+
+import re
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from terraform_versions import (
+    TerraformFile,
+    update,
+    _remove_tree,
+    find_lock_files,
+    find_terraform_dirs,
+    find_terraform_files,
+    find_terraform_modules,
+    scan_repo,
+)
+
+VERSIONS_TF = """terraform {
+  required_version = ">= 1.0.0"
+
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 4.0"
+    }
+    google = {
+      source  = "hashicorp/google"
+      version = "~> 5.0"
+    }
+  }
+}
+"""
+
+SAMPLES = [
+    VERSIONS_TF,
+    'terraform {\n  required_version = ">= 1.7.0"\n}\n',
+    'terraform {\n  required_providers {\n    aws = {\n      version = ">= 5.70.0"\n'
+    "    }\n  }\n}\n",
+    'terraform {\n  required_providers {\n    aws = {\n      source = "hashicorp/aws"\n'
+    "    }\n  }\n}\n",
+    'resource "aws_s3_bucket" "logs" {\n  bucket = "logs"\n}\n',
+    "",
+]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a Terraform repo with .terraform directories that must be pruned."""
+    files = [
+        "main.tf",
+        "README.md",
+        "app/main.tf",
+        "app/.terraform.lock.hcl",
+        "app/.terraform/modules/vpc/main.tf",
+        "app/.terraform/.terraform.lock.hcl",
+        "app/nested/network.tf",
+        "app/nested/.terraform.lock.hcl",
+        "app/nested/.terraform/providers/aws",
+        ".terraform/modules/modules.json",
+    ]
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('terraform {\n  required_version = ">= 1.0.0"\n}\n')
+    return tmp_path
+
+
+def two_pass_update(content, tf_version, aws_version):
+    """The original str-based update: one re.sub for each constraint."""
+    tf_content = re.sub(
+        r'(required_version\s*=\s*)"([^"]+)"', rf'\1"{tf_version}"', content
+    )
+    aws_content = re.sub(
+        r'(aws\s*=\s*\{[^}]*version\s*=\s*)"([^"]+)"([^}]*\})',
+        rf'\1"{aws_version}"\3',
+        tf_content,
+        flags=re.DOTALL,
+    )
+    return tf_content != content, aws_content != tf_content, aws_content
+
+
+@pytest.mark.parametrize("recursive", [False, True])
+def test_scan_repo_matches_find_functions(repo, recursive):
+    """Test one scan_repo walk finds what the separate find_* walks find."""
+    scan = scan_repo(repo, recursive)
+    assert sorted(scan["tf_files"]) == sorted(find_terraform_files(repo, recursive))
+    assert sorted(scan["lock_files"]) == sorted(find_lock_files(repo, recursive))
+    assert scan["modules"] == find_terraform_modules(repo, recursive)
+    assert sorted(scan["tf_dirs"]) == sorted(find_terraform_dirs(repo, recursive))
+
+
+def test_find_terraform_files_prunes_terraform_dirs(repo):
+    """Test nothing below a .terraform directory is returned."""
+    assert sorted(find_terraform_files(repo, recursive=True)) == [
+        repo / "app/main.tf",
+        repo / "app/nested/network.tf",
+        repo / "main.tf",
+    ]
+    assert sorted(find_lock_files(repo, recursive=True)) == [
+        repo / "app/.terraform.lock.hcl",
+        repo / "app/nested/.terraform.lock.hcl",
+    ]
+    assert sorted(find_terraform_dirs(repo, recursive=True)) == [
+        repo / ".terraform",
+        repo / "app/.terraform",
+        repo / "app/nested/.terraform",
+    ]
+
+
+def test_find_non_recursive_depths(repo):
+    """Test non-recursive mode keeps .tf files at the top and lock files one down."""
+    assert find_terraform_files(repo) == [repo / "main.tf"]
+    assert find_lock_files(repo) == [repo / "app/.terraform.lock.hcl"]
+    assert sorted(find_terraform_dirs(repo)) == [
+        repo / ".terraform",
+        repo / "app/.terraform",
+    ]
+
+
+def test_find_inside_terraform_dir(repo):
+    """Test a starting path inside .terraform finds nothing."""
+    assert find_terraform_files(repo / "app/.terraform/modules/vpc") == []
+    assert scan_repo(repo / "app/.terraform", recursive=True)["tf_files"] == []
+
+
+@pytest.mark.parametrize("content", SAMPLES)
+def test_update_versions_matches_two_pass(tmp_path, content):
+    """Test the single-pass update gives the same result as two re.sub passes."""
+    path = tmp_path / "versions.tf"
+    path.write_text(content)
+    tf_file = TerraformFile(path)
+
+    tf_updated, providers = tf_file.update_versions(">= 1.7.0", {"aws": ">= 5.70.0"})
+
+    expected_tf, expected_aws, expected = two_pass_update(
+        content, ">= 1.7.0", ">= 5.70.0"
+    )
+    assert (tf_updated, "aws" in providers) == (expected_tf, expected_aws)
+    assert tf_file.content.decode() == expected
+
+
+def test_update_versions_leaves_other_providers(tmp_path):
+    """Test only the requested providers are updated."""
+    path = tmp_path / "versions.tf"
+    path.write_text(VERSIONS_TF)
+    tf_file = TerraformFile(path)
+
+    assert tf_file.update_versions(">= 1.7.0", {"aws": ">= 5.70.0"}) == (True, {"aws"})
+    assert tf_file.save()
+    content = path.read_text()
+    assert 'version = ">= 5.70.0"' in content
+    assert 'version = "~> 5.0"' in content
+
+
+def test_backup_of_symlink_keeps_original_content(tmp_path):
+    """Test backing up a symlinked file keeps the target's content before save."""
+    target = tmp_path / "versions.tf"
+    target.write_text(VERSIONS_TF)
+    link = tmp_path / "link.tf"
+    link.symlink_to(target)
+    tf_file = TerraformFile(link)
+
+    backup_path = tf_file.backup()
+    tf_file.update_versions(">= 1.7.0", {"aws": ">= 5.70.0"})
+    assert tf_file.save()
+
+    assert backup_path.read_text() == VERSIONS_TF
+    assert link.is_symlink()
+    assert 'required_version = ">= 1.7.0"' in target.read_text()
+
+
+def test_update_symlinks_to_one_file(tmp_path):
+    """Test symlinks to a shared file update and back it up exactly once."""
+    target = tmp_path / "shared/versions.tf"
+    target.parent.mkdir()
+    target.write_text(VERSIONS_TF)
+    mods = tmp_path / "mods"
+    mods.mkdir()
+    for name in ("a.tf", "b.tf"):
+        (mods / name).symlink_to(target)
+
+    result = CliRunner().invoke(
+        update, ["--path", str(mods), "--backup", "--jobs", "2"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Modified 1 files" in result.output
+    backups = sorted(p.name for p in mods.glob("*.backup"))
+    assert len(backups) == 1
+    assert (mods / backups[0]).read_text() == VERSIONS_TF
+    assert 'required_version = ">= 1.7.0"' in target.read_text()
+
+
+@pytest.mark.parametrize("size", [True, False])
+def test_remove_tree_does_not_follow_symlinks(tmp_path, size):
+    """Test symlinks are removed without touching what they point to."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+    tree = tmp_path / ".terraform"
+    (tree / "providers/aws").mkdir(parents=True)
+    (tree / "providers/aws/terraform-provider-aws").write_bytes(b"x" * 1000)
+    (tree / "modules.json").write_bytes(b"x" * 24)
+    (tree / "dir_link").symlink_to(outside)
+    (tree / "file_link").symlink_to(outside / "keep.txt")
+    (tree / "broken_link").symlink_to(tmp_path / "missing")
+
+    removed = _remove_tree(tree, jobs=4, size=size)
+
+    assert removed == (1024 if size else 0)
+    assert not tree.exists()
+    assert (outside / "keep.txt").read_text() == "keep"
+
+
+if __name__ == "__main__":
+    # Run pytest when this script is executed directly
+    sys.exit(pytest.main(["-v", __file__]))